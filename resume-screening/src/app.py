@@ -2,10 +2,7 @@
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-from pathlib import Path
-import os
-from resume_parser import ResumeParser, display_parsed_resume
+from resume_parser import ResumeParser, display_parsed_resume, extract_skills_batch
 from skill_matcher import SkillMatcher, display_job_skills, display_candidate_ranking, display_comparison_table  
 
 
@@ -104,21 +101,40 @@ def main():
                     st.markdown("## 📊 Resume Analysis Results")
                     st.info(f"📁 Processing {len(uploaded_files)} resume file(s)...")
                     
-                    all_parsed_resumes = []
-                    for i, uploaded_file in enumerate(uploaded_files):
-                        st.markdown(f"---")
-                        st.markdown(f"**📄 Resume #{i+1}: {uploaded_file.name}**")
-                        parsed_data = parser.parse_resume(uploaded_file)
-                        display_parsed_resume(parsed_data)
-                        all_parsed_resumes.append(parsed_data)
+                    # Read every upload's bytes up front, before any parsing starts
+                    blobs = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+                    
+                    # Parse every resume before rendering anything
+                    all_parsed_resumes = [parser.parse_bytes(filename, data, False) for filename, data in blobs]
+                    
+                    # Fill in skills for the whole batch with one vectorized scan
+                    parsed_ok = [p for p in all_parsed_resumes if 'error' not in p]
+                    batch_skills = extract_skills_batch([p['raw_text'] for p in parsed_ok])
+                    for parsed_data, skills in zip(parsed_ok, batch_skills):
+                        parsed_data['skills'] = skills
+                    
+                    # Render results in upload order once parsing is done, grouped in
+                    # one container so they stay together on the page
+                    with st.container():
+                        for i, ((filename, _), parsed_data) in enumerate(zip(blobs, all_parsed_resumes)):
+                            st.markdown(f"---")
+                            st.markdown(f"**📄 Resume #{i+1}: {filename}**")
+                            display_parsed_resume(parsed_data)
+                            # Full text is only needed for the render above; drop it so
+                            # session_state doesn't hold every resume's text
+                            parsed_data.pop('raw_text', None)
                     
                     st.success(f"✅ Successfully processed {len(uploaded_files)} resume(s)!")
                     
                     # Store results in session state for the View Results button
-                    st.session_state.parsed_resumes = all_parsed_resumes
                     st.session_state.job_description = job_description
                     st.session_state.job_skills = skill_matcher.extract_job_skills(job_description)
                     st.session_state.ranked_candidates = skill_matcher.rank_candidates(all_parsed_resumes, job_description)
+                    # Scores are also kept column-wise for the summary statistics
+                    st.session_state.ranked_df = pd.DataFrame([
+                        {'rank': c['rank'], 'filename': c['resume_data']['filename'], **c['score_data']}
+                        for c in st.session_state.ranked_candidates
+                    ]).drop(columns='category_scores', errors='ignore')
                     
                     # Debug information
                     st.markdown("---")
@@ -144,20 +160,21 @@ def main():
                     display_job_skills(st.session_state.job_skills)
                     
                     # Display candidate ranking
-                    display_candidate_ranking(st.session_state.ranked_candidates)
+                    display_candidate_ranking(st.session_state.ranked_candidates, st.session_state.job_skills)
                     
                     # Show summary statistics
                     st.markdown("---")
                     st.markdown("## 📈 Summary Statistics")
                     
-                    total_candidates = len(st.session_state.ranked_candidates)
-                    avg_score = sum(c['score_data']['overall_score'] for c in st.session_state.ranked_candidates) / total_candidates
-                    top_score = max(c['score_data']['overall_score'] for c in st.session_state.ranked_candidates)
+                    ranked_df = st.session_state.ranked_df
+                    total_candidates = len(ranked_df)
+                    avg_score, top_score = ranked_df['overall_score'].agg(['mean', 'max'])
                     
                     # Display metrics in a simple row format without columns
                     st.write(f"📊 **Total Candidates:** {total_candidates}")
                     st.write(f"📈 **Average Score:** {avg_score:.1f}/100")
-                    st.write(f"🏆 **Top Score:** {top_score}/100")
+                    # The column is float64; :g keeps a capped 100 reading "100/100"
+                    st.write(f"🏆 **Top Score:** {top_score:g}/100")
                     
                 else:
                     st.warning("⚠️ No results available. Please run the screening first.")
@@ -1,9 +1,11 @@
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 import io
 import re
-from typing import Dict, List, Tuple
+import hashlib
+import threading
+import itertools
+from typing import Dict, List, Optional
 
 # Import document processing libraries
 try:
@@ -12,6 +14,187 @@ try:
 except ImportError:
     st.error("Required libraries not found. Please install: pip install pypdf python-docx")
 
+# pypdfium2 wraps the PDFium C++ engine and extracts text several times faster
+# than pypdf; it is optional and pypdf is used whenever it is missing or fails
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PDFium is not thread-safe and Streamlit runs each session's script in its own thread
+_PDFIUM_LOCK = threading.Lock()
+
+# pyahocorasick gives linear-time multi-pattern matching for large skill lists;
+# it is optional and the regex alternation is used whenever it is missing
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Common technical skills
+COMMON_SKILLS = [
+    'python', 'java', 'javascript', 'html', 'css', 'sql', 'mongodb', 'mysql',
+    'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring',
+    'machine learning', 'ai', 'artificial intelligence', 'data analysis',
+    'excel', 'powerbi', 'tableau', 'aws', 'azure', 'docker', 'kubernetes',
+    'git', 'agile', 'scrum', 'project management', 'leadership'
+]
+
+# Single alternation over all skills, compiled once per process. Only a leading
+# \b, like EDUCATION_PATTERN, so compound forms such as "ReactJS", "GitHub" or
+# "Dockerized" still count, as they do when a job description is scanned.
+# Longer skills come first so e.g. 'javascript' wins over 'java' at the same
+# position; SKILL_PREFIXES adds the shorter one back.
+SKILL_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(skill) for skill in sorted(COMMON_SKILLS, key=len, reverse=True)) + r')'
+)
+
+# Skills that are a prefix of a longer skill, so matching the longer one also
+# means the shorter one occurs at a word start ('javascript' -> 'java')
+SKILL_PREFIXES = {
+    skill: [other for other in COMMON_SKILLS if other != skill and skill.startswith(other)]
+    for skill in COMMON_SKILLS
+}
+
+# Past this many skills the regex alternation gets slow and is replaced by an
+# Aho-Corasick automaton, whose cost per character doesn't grow with the list
+AHO_CORASICK_MIN_SKILLS = 64
+
+def _build_skill_automaton(skills: List[str]):
+    """Build an Aho-Corasick automaton mapping each skill to itself"""
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+SKILL_AUTOMATON = (
+    _build_skill_automaton(COMMON_SKILLS)
+    if ahocorasick is not None and len(COMMON_SKILLS) > AHO_CORASICK_MIN_SKILLS
+    else None
+)
+
+# Experience patterns ("5+ years of experience", "Experience: 5 years",
+# "5 years in the field") folded into one case-insensitive alternation
+EXPERIENCE_PATTERN = re.compile(
+    r'(\d+)\+?\s*years?\s*(?:(?:of\s*)?experience|in\s*the\s*field)'
+    r'|experience:\s*(\d+)\+?\s*years?',
+    re.IGNORECASE
+)
+
+def _file_hash(data: bytes) -> str:
+    """Content hash identifying an uploaded file"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# Keywords marking a line as education information
+EDUCATION_KEYWORDS = [
+    'bachelor', 'master', 'phd', 'degree', 'university', 'college',
+    'diploma', 'certification', 'certificate'
+]
+
+# Any line mentioning one of the keywords. No trailing \b so plurals such as
+# "Masters" or "Degrees" still count, as with substring matching.
+EDUCATION_PATTERN = re.compile(
+    r'^[^\n]*\b(?:' + '|'.join(re.escape(keyword) for keyword in EDUCATION_KEYWORDS) + r')[^\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def _extract_pdf_text_pdfium(data: bytes) -> str:
+    """Extract text from PDF bytes with PDFium"""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            parts = [page.get_textpage().get_text_range() for page in pdf]
+        finally:
+            pdf.close()
+    # PDFium ends lines with \r\n; the extractors split on \n
+    return "\n".join(parts).replace("\r\n", "\n").strip()
+
+# Text extraction is a pure function of the file bytes, so cache it per process
+# and skip re-running pypdf/python-docx when the same resume is screened again.
+# The cache is keyed on file_hash; the leading underscore tells Streamlit not to
+# hash the bytes a second time.
+@st.cache_data(show_spinner=False, max_entries=256)
+def _extract_pdf_text(file_hash: str, _data: bytes) -> str:
+    """Extract text from PDF bytes"""
+    if pdfium is not None:
+        try:
+            return _extract_pdf_text_pdfium(_data)
+        except Exception:
+            pass  # Fall back to pypdf below
+    
+    try:
+        pdf_reader = PdfReader(io.BytesIO(_data))
+        # Collect pages and join once instead of re-copying the string per page
+        parts = []
+        for page in pdf_reader.pages:
+            parts.append(page.extract_text() or "")
+        return "\n".join(parts).strip()
+    except Exception as e:
+        st.error(f"Error reading PDF: {str(e)}")
+        return ""
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _extract_docx_text(file_hash: str, _data: bytes) -> str:
+    """Extract text from DOCX bytes"""
+    try:
+        doc = Document(io.BytesIO(_data))
+        parts = []
+        for paragraph in doc.paragraphs:
+            parts.append(paragraph.text)
+        return "\n".join(parts).strip()
+    except Exception as e:
+        st.error(f"Error reading DOCX: {str(e)}")
+        return ""
+
+def _skill_titles(matches: List[str]) -> List[str]:
+    """Title-case matched skills and the skills they start with, dropping repeats, in sorted order"""
+    found_skills = set()
+    for skill in matches:
+        found_skills.add(skill.title())
+        found_skills.update(prefix.title() for prefix in SKILL_PREFIXES[skill])
+    # Sorted so the UI and ranking see the same order on every run
+    return sorted(found_skills)
+
+def _is_word_char(char: str) -> bool:
+    """Whether char is a regex word character"""
+    return char.isalnum() or char == '_'
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Whether a regex word boundary falls just before text[index]"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+def _find_skills(text_lower: str) -> List[str]:
+    """Find every skill mentioned in lowercased text, in one scan"""
+    if SKILL_AUTOMATON is None:
+        return SKILL_PATTERN.findall(text_lower)
+    
+    # The automaton matches substrings; keep only hits starting a word, as
+    # SKILL_PATTERN does
+    found_skills = []
+    for end, skill in SKILL_AUTOMATON.iter(text_lower):
+        if _at_word_boundary(text_lower, end - len(skill) + 1):
+            found_skills.append(skill)
+    return found_skills
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _extract_skills(text_lower: str) -> List[str]:
+    """Extract skills from lowercased resume text"""
+    return _skill_titles(_find_skills(text_lower))
+
+def extract_skills_batch(texts: List[str]) -> List[List[str]]:
+    """Extract skills from many resume texts in a single pandas pass"""
+    # Imported here so loading the parser doesn't pay pandas' import cost
+    import pandas as pd
+    texts_lower = pd.Series(texts, dtype=object).str.lower()
+    if SKILL_AUTOMATON is None:
+        matches = texts_lower.str.findall(SKILL_PATTERN)
+    else:
+        matches = texts_lower.map(_find_skills)
+    return [_skill_titles(found) for found in matches]
+
 class ResumeParser:
     """Class to parse and extract text from resume files"""
     
@@ -20,105 +203,72 @@ class ResumeParser:
     
     def extract_text_from_pdf(self, pdf_file) -> str:
         """Extract text from PDF file"""
-        try:
-            pdf_reader = PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
-        except Exception as e:
-            st.error(f"Error reading PDF: {str(e)}")
-            return ""
+        data = pdf_file.getvalue()
+        return _extract_pdf_text(_file_hash(data), data)
     
     def extract_text_from_docx(self, docx_file) -> str:
         """Extract text from DOCX file"""
-        try:
-            doc = Document(docx_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
-        except Exception as e:
-            st.error(f"Error reading DOCX: {str(e)}")
-            return ""
-    
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from resume text"""
-        # Common technical skills
-        common_skills = [
-            'python', 'java', 'javascript', 'html', 'css', 'sql', 'mongodb', 'mysql',
-            'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring',
-            'machine learning', 'ai', 'artificial intelligence', 'data analysis',
-            'excel', 'powerbi', 'tableau', 'aws', 'azure', 'docker', 'kubernetes',
-            'git', 'agile', 'scrum', 'project management', 'leadership'
-        ]
-        
-        # Convert text to lowercase for matching
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill.title())
-        
-        return found_skills
-    
-    def extract_experience(self, text: str) -> str:
-        """Extract years of experience from resume text"""
-        # Look for experience patterns
-        experience_patterns = [
-            r'(\d+)\+?\s*years?\s*of?\s*experience',
-            r'experience:\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in\s*the\s*field'
-        ]
-        
-        for pattern in experience_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return match.group(1) + " years"
+        data = docx_file.getvalue()
+        return _extract_docx_text(_file_hash(data), data)
+    
+    def extract_skills(self, text_lower: str) -> List[str]:
+        """Extract skills from lowercased resume text"""
+        return _extract_skills(text_lower)
+    
+    def extract_experience(self, text_lower: str) -> Optional[int]:
+        """Extract years of experience from lowercased resume text"""
+        match = EXPERIENCE_PATTERN.search(text_lower)
+        if match:
+            # Only one of the two alternatives' groups is set
+            return int(match.group(1) or match.group(2))
         
-        return "Experience not specified"
+        return None
     
     def extract_education(self, text: str) -> List[str]:
         """Extract education information from resume text"""
-        education_keywords = [
-            'bachelor', 'master', 'phd', 'degree', 'university', 'college',
-            'diploma', 'certification', 'certificate'
-        ]
-        
-        lines = text.split('\n')
-        education_lines = []
-        
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in education_keywords):
-                education_lines.append(line.strip())
-        
-        return education_lines[:3]  # Return top 3 education entries
+        # One scan yielding whole matching lines; stop after the top 3 entries
+        matches = itertools.islice(EDUCATION_PATTERN.finditer(text), 3)
+        return [match.group(0).strip() for match in matches]
     
-    def parse_resume(self, file) -> Dict:
+    def parse_resume(self, file, with_skills: bool = True) -> Dict:
         """Main method to parse a resume file and extract information"""
-        file_extension = Path(file.name).suffix.lower()
+        return self.parse_bytes(file.name, file.getvalue(), with_skills)
+    
+    def parse_bytes(self, filename: str, data: bytes, with_skills: bool = True) -> Dict:
+        """Parse a resume from its filename and raw bytes
+        
+        Works on plain bytes rather than Streamlit's UploadedFile, so callers
+        can read every upload once up front. Pass with_skills=False when skills
+        are filled in afterwards for a whole batch with extract_skills_batch.
+        """
+        file_extension = Path(filename).suffix.lower()
         
         if file_extension not in self.supported_formats:
             return {"error": f"Unsupported file format: {file_extension}"}
         
+        # The content hash keys the extraction cache
+        file_hash = _file_hash(data)
+        
         # Extract text based on file type
         if file_extension == '.pdf':
-            text = self.extract_text_from_pdf(file)
+            text = _extract_pdf_text(file_hash, data)
         else:  # .docx
-            text = self.extract_text_from_docx(file)
+            text = _extract_docx_text(file_hash, data)
         
         if not text:
             return {"error": "Could not extract text from file"}
         
+        # Lowercase once and share it across the extractors; text is kept for display
+        text_lower = text.lower()
+        
         # Extract information
         parsed_data = {
-            "filename": file.name,
+            "filename": filename,
             "file_type": file_extension,
+            "file_hash": file_hash,
             "raw_text": text,
-            "skills": self.extract_skills(text),
-            "experience": self.extract_experience(text),
+            "skills": self.extract_skills(text_lower) if with_skills else [],
+            "experience": self.extract_experience(text_lower),
             "education": self.extract_education(text),
             "text_length": len(text),
             "word_count": len(text.split())
@@ -126,6 +276,10 @@ class ResumeParser:
         
         return parsed_data
 
+def format_experience(years: Optional[int]) -> str:
+    """Format extracted years of experience for display"""
+    return f"{years} years" if years is not None else "Experience not specified"
+
 def display_parsed_resume(parsed_data: Dict):
     """Display parsed resume information in a nice format"""
     if "error" in parsed_data:
@@ -144,7 +298,7 @@ def display_parsed_resume(parsed_data: Dict):
         st.warning("No specific skills detected")
     
     # Experience section
-    st.markdown(f"**⏰ Experience:** {parsed_data['experience']}")
+    st.markdown(f"**⏰ Experience:** {format_experience(parsed_data['experience'])}")
     
     # Education section
     if parsed_data['education']:
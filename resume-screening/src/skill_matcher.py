@@ -1,10 +1,38 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Tuple
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+from typing import Collection, Dict, Iterable, List, Optional
+from resume_parser import format_experience
+
+# pyahocorasick finds every skill in one pass over the text; it is optional
+# and a plain substring scan is used whenever it is missing
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Degree mentions and the education bonus each one earns, matched in one pass
+# over a lowercased education entry. Abbreviations are spelled out with and
+# without dots ("msc", "m.sc") since whole-word matching won't find "ms" in
+# "msc" the way substring matching did.
+DEGREE_PATTERN = re.compile(
+    r'\b(phd|ph\.d|doctorate'
+    r'|masters?|mba|ms|m\.s|msc|m\.sc|meng|m\.eng|mtech|m\.tech'
+    r'|bachelors?|bs|b\.s|bsc|b\.sc|beng|b\.eng|btech|b\.tech|b\.e'
+    r'|diploma|associate)\b'
+)
+DEGREE_BONUS = {
+    'phd': 10, 'ph.d': 10, 'doctorate': 10,
+    'master': 7, 'masters': 7, 'mba': 7, 'ms': 7, 'm.s': 7, 'msc': 7, 'm.sc': 7,
+    'meng': 7, 'm.eng': 7, 'mtech': 7, 'm.tech': 7,
+    'bachelor': 4, 'bachelors': 4, 'bs': 4, 'b.s': 4, 'bsc': 4, 'b.sc': 4,
+    'beng': 4, 'b.eng': 4, 'btech': 4, 'b.tech': 4, 'b.e': 4,
+    'diploma': 2, 'associate': 2
+}
+
+# Fields preprocess_resume attaches to a resume; together they are all the
+# resume-side input job scoring needs
+RESUME_FEATURE_KEYS = ('_skill_mask', '_skill_count', '_experience_bonus', '_education_bonus', '_diversity_bonus')
 
 class SkillMatcher:
     """Class to match resume skills with job requirements and rank candidates"""
@@ -45,128 +73,172 @@ class SkillMatcher:
             ]
         }
         
-        # Flatten all skills into one list
-        self.all_skills = []
-        for category_skills in self.skill_categories.values():
-            self.all_skills.extend(category_skills)
+        # Lowercase skill sets per category and overall, for O(1) membership tests
+        self._category_sets = {
+            category: frozenset(map(str.lower, skills)) for category, skills in self.skill_categories.items()
+        }
+        self.all_skills = frozenset().union(*self._category_sets.values())
+        
+        # One automaton over every skill, so a job description is scanned once
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for skill in self.all_skills:
+                self._automaton.add_word(skill, skill)
+            self._automaton.make_automaton()
+        
+        # Bit position per skill, so a set of skills packs into one int and
+        # set intersection becomes a bitwise AND. Positions follow category
+        # order rather than all_skills' set order, so they are stable per run.
+        ordered_skills = dict.fromkeys(skill.lower() for skills in self.skill_categories.values() for skill in skills)
+        self._skill_id = {skill: i for i, skill in enumerate(ordered_skills)}
+        self._category_masks = {
+            category: self._skills_mask(skills) for category, skills in self.skill_categories.items()
+        }
+    
+    def _skills_mask(self, skills: List[str]) -> int:
+        """Pack known skills (any case) into a bitmask; unknown skills are ignored"""
+        mask = 0
+        for skill in skills:
+            skill_id = self._skill_id.get(skill.lower())
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+    
+    def _categories_covered(self, resume_mask: int) -> int:
+        """Count skill categories sharing at least one skill with the resume"""
+        return sum(1 for category_mask in self._category_masks.values() if resume_mask & category_mask)
+    
+    def _mentioned_skills(self, text_lower: str) -> set:
+        """Return every known skill occurring as a substring of the lowercased text"""
+        if self._automaton is None:
+            return {skill for skill in self.all_skills if skill in text_lower}
+        return {skill for _, skill in self._automaton.iter(text_lower)}
     
     def extract_job_skills(self, job_description: str) -> Dict[str, List[str]]:
-        """Extract required skills from job description"""
+        """Extract required skills from job description, lowercased"""
         job_lower = job_description.lower()
+        mentioned = self._mentioned_skills(job_lower)
         found_skills = {}
         
+        # Keep each category's own skill order in the output
         for category, skills in self.skill_categories.items():
-            category_found = []
-            for skill in skills:
-                if skill in job_lower:
-                    category_found.append(skill.title())
+            if self._category_sets[category].isdisjoint(mentioned):
+                continue
+            category_found = [skill for skill in skills if skill in mentioned]
             if category_found:
                 found_skills[category] = category_found
         
         # If no skills found, try to extract some basic ones
         if not found_skills:
             basic_skills = ['python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'node.js']
-            basic_found = []
-            for skill in basic_skills:
-                if skill in job_lower:
-                    basic_found.append(skill.title())
+            basic_found = [skill for skill in basic_skills if skill in mentioned]
             if basic_found:
                 found_skills['general_skills'] = basic_found
         
         return found_skills
     
-    def calculate_skill_match_score(self, resume_skills: List[str], job_skills: List[str]) -> float:
+    def calculate_skill_match_score(self, resume_skills: Collection[str], job_skills: Iterable[str]) -> float:
         """Calculate how well resume skills match job requirements"""
-        if not job_skills:
-            return 0.0
+        # Convert to lowercase for comparison
+        resume_set = frozenset(skill.lower() for skill in resume_skills)
+        job_set = frozenset(skill.lower() for skill in job_skills)
         
-        if not resume_skills:
+        return self._score_against(resume_set, len(resume_skills), job_set)
+    
+    def _score_against(self, resume_set: frozenset, resume_skill_count: int, job_set: frozenset) -> float:
+        """Score a resume's lowercased skill set against a lowercase job skill set"""
+        if not job_set:
             return 0.0
         
-        # Convert to lowercase for comparison
-        resume_lower = [skill.lower() for skill in resume_skills]
-        job_lower = [skill.lower() for skill in job_skills]
+        if not resume_skill_count:
+            return 0.0
         
-        # Count matching skills
-        matches = sum(1 for skill in job_lower if skill in resume_lower)
+        # Count matching skills with one set intersection
+        matches = len(resume_set & job_set)
         
+        return self._category_score(matches, len(job_set), resume_skill_count)
+    
+    def _category_score(self, matches: int, job_skill_count: int, resume_skill_count: int) -> float:
+        """Score a category from its match count"""
         # Calculate percentage match
-        match_percentage = (matches / len(job_lower)) * 100
+        match_percentage = (matches / job_skill_count) * 100
         
         # Add variation based on skill count to differentiate resumes
-        skill_count_bonus = min(5, len(resume_skills) * 0.5)  # Bonus for having more skills
+        skill_count_bonus = min(5, resume_skill_count * 0.5)  # Bonus for having more skills
         
         # Add variation based on how many job skills are covered
-        coverage_bonus = min(10, (matches / len(job_lower)) * 20)  # Bonus for covering more job requirements
+        coverage_bonus = min(10, (matches / job_skill_count) * 20)  # Bonus for covering more job requirements
         
         final_score = min(100, match_percentage + skill_count_bonus + coverage_bonus)
         
         return round(final_score, 2)
     
-    def calculate_overall_score(self, resume_data: Dict, job_skills: Dict[str, List[str]]) -> Dict:
-        """Calculate overall matching score for a candidate"""
+    def preprocess_resume(self, resume_data: Dict) -> Dict:
+        """Attach the job-independent scoring features to resume_data and return it"""
         resume_skills = resume_data.get('skills', [])
-        
-        # Calculate skill match scores for each category
-        category_scores = {}
-        total_score = 0
-        category_count = 0
-        
-        for category, skills in job_skills.items():
-            if skills:  # Only calculate if category has skills
-                score = self.calculate_skill_match_score(resume_skills, skills)
-                category_scores[category] = score
-                total_score += score
-                category_count += 1
-        
-        # Calculate overall score
-        overall_score = round(total_score / category_count, 2) if category_count > 0 else 0
+        resume_mask = self._skills_mask(resume_skills)
         
         # Experience bonus (up to 15 points) - More differentiation
         experience_bonus = 0
-        experience_text = resume_data.get('experience', '')
-        if 'years' in experience_text.lower():
-            try:
-                years = int(re.search(r'(\d+)', experience_text).group(1))
-                if years >= 8:
-                    experience_bonus = 15
-                elif years >= 5:
-                    experience_bonus = 12
-                elif years >= 3:
-                    experience_bonus = 8
-                elif years >= 1:
-                    experience_bonus = 5
-            except:
-                pass
+        years = resume_data.get('experience')
+        if years is not None:
+            if years >= 8:
+                experience_bonus = 15
+            elif years >= 5:
+                experience_bonus = 12
+            elif years >= 3:
+                experience_bonus = 8
+            elif years >= 1:
+                experience_bonus = 5
         
         # Education bonus (up to 10 points) - More differentiation
+        # Highest degree across the entries wins; nothing beats a doctorate
         education_bonus = 0
         education = resume_data.get('education', [])
         for edu in education:
-            if any(degree in edu.lower() for degree in ['phd', 'doctorate']):
-                education_bonus = 10
-                break
-            elif any(degree in edu.lower() for degree in ['master', 'mba', 'ms']):
-                education_bonus = 7
-                break
-            elif any(degree in edu.lower() for degree in ['bachelor', 'b.tech', 'b.e', 'bs']):
-                education_bonus = 4
-                break
-            elif any(degree in edu.lower() for degree in ['diploma', 'associate']):
-                education_bonus = 2
+            for match in DEGREE_PATTERN.finditer(edu.lower()):
+                education_bonus = max(education_bonus, DEGREE_BONUS[match.group(1)])
+            if education_bonus == 10:
                 break
         
         # Skills diversity bonus (up to 10 points) - New bonus for having diverse skills
         skills_diversity_bonus = 0
         if resume_skills:
             # Bonus for having skills from multiple categories
-            skill_categories_covered = 0
-            for category_skills in self.skill_categories.values():
-                if any(skill.lower() in [s.lower() for s in resume_skills] for skill in category_skills):
-                    skill_categories_covered += 1
+            skill_categories_covered = self._categories_covered(resume_mask)
             
             skills_diversity_bonus = min(10, skill_categories_covered * 2)
         
+        resume_data['_skill_mask'] = resume_mask
+        resume_data['_skill_count'] = len(resume_skills)
+        resume_data['_experience_bonus'] = experience_bonus
+        resume_data['_education_bonus'] = education_bonus
+        resume_data['_diversity_bonus'] = skills_diversity_bonus
+        
+        return resume_data
+    
+    def calculate_overall_score(self, resume_data: Dict, job_skills: Dict[str, List[str]]) -> Dict:
+        """Calculate overall matching score for a candidate"""
+        # Read the features preprocess_resume attached, or work them out on a
+        # copy so the caller's dict is left untouched
+        if '_skill_mask' not in resume_data:
+            resume_data = self.preprocess_resume(dict(resume_data))
+        
+        # Same code path as ranking, so single and batch scores cannot drift apart
+        return self.score_resumes([resume_data], job_skills)[0]
+    
+    def _complete_score(self, resume_data: Dict, category_scores: Dict[str, float]) -> Dict:
+        """Combine per-category scores with the bonuses attached by preprocess_resume"""
+        # Calculate overall score
+        total_score = sum(category_scores.values())
+        category_count = len(category_scores)
+        overall_score = round(total_score / category_count, 2) if category_count > 0 else 0
+        
+        experience_bonus = resume_data['_experience_bonus']
+        education_bonus = resume_data['_education_bonus']
+        skills_diversity_bonus = resume_data['_diversity_bonus']
+        
         # Final score with all bonuses
         final_score = min(100, overall_score + experience_bonus + education_bonus + skills_diversity_bonus)
         
@@ -184,23 +256,35 @@ class SkillMatcher:
         # Extract job skills
         job_skills = self.extract_job_skills(job_description)
         
+        valid_resumes = [resume_data for resume_data in resumes_data if 'error' not in resume_data]
+        if not valid_resumes:
+            return []
+        
+        # Job-independent features are worked out once per resume here, then
+        # double as an exact, hashable key for the cross-rerun score cache
+        resume_features = tuple(
+            tuple(self.preprocess_resume(r)[key] for key in RESUME_FEATURE_KEYS) for r in valid_resumes
+        )
+        job_items = tuple((category, tuple(skills)) for category, skills in job_skills.items())
+        
         # Calculate scores for each candidate
         ranked_candidates = []
         
-        for resume_data in resumes_data:
-            if 'error' not in resume_data:
-                score_data = self.calculate_overall_score(resume_data, job_skills)
-                
-                candidate_info = {
-                    'resume_data': resume_data,
-                    'score_data': score_data,
-                    'rank': 0  # Will be set after sorting
-                }
-                
-                ranked_candidates.append(candidate_info)
-        
-        # Sort by overall score (highest first)
-        ranked_candidates.sort(key=lambda x: x['score_data']['overall_score'], reverse=True)
+        for resume_data, score_data in zip(valid_resumes, _score_resumes_cached(resume_features, job_items)):
+            candidate_info = {
+                'resume_data': resume_data,
+                'score_data': score_data,
+                'rank': 0  # Will be set after sorting
+            }
+            
+            ranked_candidates.append(candidate_info)
+        
+        # Sort by overall score (highest first); stable, so ties keep upload order
+        overall_scores = np.fromiter(
+            (c['score_data']['overall_score'] for c in ranked_candidates), dtype=float, count=len(ranked_candidates)
+        )
+        order = np.argsort(-overall_scores, kind='stable')
+        ranked_candidates = [ranked_candidates[i] for i in order]
         
         # Assign ranks
         for i, candidate in enumerate(ranked_candidates):
@@ -208,6 +292,77 @@ class SkillMatcher:
         
         return ranked_candidates
     
+    def score_resumes(self, resumes_data: List[Dict], job_skills: Dict[str, List[str]]) -> List[Dict]:
+        """Calculate score data for many resumes at once, in input order
+        
+        Resumes must already have been through preprocess_resume.
+        """
+        # Score every (resume, category) pair at once; same arithmetic as
+        # _category_score, applied element-wise
+        categories = [category for category, skills in job_skills.items() if skills]
+        # Lowercase and de-duplicate job skills, as calculate_skill_match_score does
+        job_sets = {category: frozenset(skill.lower() for skill in job_skills[category]) for category in categories}
+        category_matrix = np.zeros((len(resumes_data), len(categories)))
+        if resumes_data and categories:
+            resume_matrix, skill_counts = self._encode_resumes(resumes_data)
+            job_matrix, category_lengths = self._encode_job(job_sets, categories)
+            matches = resume_matrix.astype(np.int16) @ job_matrix.T.astype(np.int16)
+            
+            # Job skills outside the vocabulary have no bit position; match those by
+            # name. extract_job_skills never yields any, so ranking skips this.
+            unknown_skills = [(column, job_sets[category] - self.all_skills) for column, category in enumerate(categories)]
+            unknown_skills = [(column, unknown) for column, unknown in unknown_skills if unknown]
+            if unknown_skills:
+                for row, resume_data in enumerate(resumes_data):
+                    resume_set = frozenset(skill.lower() for skill in resume_data.get('skills', []))
+                    for column, unknown in unknown_skills:
+                        matches[row, column] += len(resume_set & unknown)
+            
+            match_ratio = matches / category_lengths
+            count_bonus = np.minimum(5, skill_counts * 0.5)
+            coverage_bonus = np.minimum(10, match_ratio * 20)
+            category_matrix = match_ratio * 100 + count_bonus[:, None] + coverage_bonus
+        
+        scores = []
+        for resume_data, row in zip(resumes_data, category_matrix.tolist()):
+            # Cap and round in Python so scores match _category_score exactly
+            category_scores = {category: round(min(100, score), 2) for category, score in zip(categories, row)}
+            scores.append(self._complete_score(resume_data, category_scores))
+        
+        return scores
+    
+    def _encode_resumes(self, resumes_data: List[Dict]):
+        """Encode preprocessed resumes as a boolean (resumes x skills) matrix plus per-resume skill counts"""
+        skill_total = len(self._skill_id)
+        mask_bytes = (skill_total + 7) // 8
+        
+        # Unpack every skill bitmask at once; bit i of a mask is column i
+        packed = np.frombuffer(
+            b''.join(r['_skill_mask'].to_bytes(mask_bytes, 'little') for r in resumes_data), dtype=np.uint8
+        ).reshape(len(resumes_data), mask_bytes)
+        resume_matrix = np.unpackbits(packed, axis=1, bitorder='little')[:, :skill_total].astype(bool)
+        
+        # Every listed skill counts, known or not, as the skill-count bonus does
+        skill_counts = np.fromiter((r['_skill_count'] for r in resumes_data), dtype=np.int64, count=len(resumes_data))
+        
+        return resume_matrix, skill_counts
+    
+    def _encode_job(self, job_sets: Dict[str, frozenset], categories: List[str]):
+        """Encode lowercase job skill sets as a boolean (categories x skills) matrix plus category sizes
+        
+        Skills outside the vocabulary count towards the size but get no column.
+        """
+        job_matrix = np.zeros((len(categories), len(self._skill_id)), dtype=bool)
+        category_lengths = np.array([len(job_sets[category]) for category in categories])
+        
+        for row, category in enumerate(categories):
+            for skill in job_sets[category]:
+                skill_id = self._skill_id.get(skill)
+                if skill_id is not None:
+                    job_matrix[row, skill_id] = True
+        
+        return job_matrix, category_lengths
+    
     def debug_skill_matching(self, resume_data: Dict, job_skills: Dict[str, List[str]]):
         """Debug function to show why scores are calculated the way they are"""
         resume_skills = resume_data.get('skills', [])
@@ -216,16 +371,22 @@ class SkillMatcher:
         st.write(f"**Resume Skills:** {resume_skills}")
         st.write(f"**Job Skills by Category:** {job_skills}")
         
+        # Ranking scores every category in one batch; flag any category where that
+        # disagrees with the single-category scorer shown here
+        batch_scores = self.calculate_overall_score(resume_data, job_skills)['category_scores']
+        
         for category, skills in job_skills.items():
             if skills:
                 score = self.calculate_skill_match_score(resume_skills, skills)
-                st.write(f"**{category}:** Required: {skills}, Score: {score}%")
+                st.write(f"**{category}:** Required: {[skill.title() for skill in skills]}, Score: {score}%")
+                if batch_scores[category] != score:
+                    st.warning(f"Batch scoring gave {category} {batch_scores[category]}% instead of {score}%")
         
         # Show experience and education analysis
-        experience_text = resume_data.get('experience', '')
+        years = resume_data.get('experience')
         education = resume_data.get('education', [])
         
-        st.write(f"**Experience Text:** {experience_text}")
+        st.write(f"**Experience Text:** {format_experience(years)}")
         st.write(f"**Education:** {education}")
         
         # Show score calculation details
@@ -238,14 +399,21 @@ class SkillMatcher:
         st.write(f"**Skills Count Bonus:** min(5, {len(resume_skills)} * 0.5) = {min(5, len(resume_skills) * 0.5):.1f}")
         
         # Calculate skills diversity bonus
-        skill_categories_covered = 0
-        for category_skills in self.skill_categories.values():
-            if any(skill.lower() in [s.lower() for s in resume_skills] for skill in category_skills):
-                skill_categories_covered += 1
+        skill_categories_covered = self._categories_covered(self._skills_mask(resume_skills))
         
         skills_diversity_bonus = min(10, skill_categories_covered * 2)
         st.write(f"**Skills Diversity Bonus:** {skill_categories_covered} categories × 2 = +{skills_diversity_bonus} points")
 
+# Streamlit reruns the script on every interaction; memoize batch scores on
+# their exact inputs so re-screening unchanged resumes against the same job
+# skills skips scoring. Returned dicts are copies, safe for callers to keep.
+@st.cache_data(show_spinner=False, max_entries=64)
+def _score_resumes_cached(resume_features: tuple, job_items: tuple) -> List[Dict]:
+    """Score resumes given as RESUME_FEATURE_KEYS tuples against job skills"""
+    resumes_data = [dict(zip(RESUME_FEATURE_KEYS, features)) for features in resume_features]
+    job_skills = {category: list(skills) for category, skills in job_items}
+    return SkillMatcher().score_resumes(resumes_data, job_skills)
+
 def display_job_skills(job_skills: Dict[str, List[str]]):
     """Display extracted job skills in a clean format"""
     st.markdown("## 🎯 Job Requirements Analysis")
@@ -262,10 +430,10 @@ def display_job_skills(job_skills: Dict[str, List[str]]):
             st.markdown(f"**{category_name}:**")
             
             # Display skills with nice formatting
-            skills_text = ", ".join(skills)
+            skills_text = ", ".join(skill.title() for skill in skills)
             st.info(skills_text)
 
-def display_candidate_ranking(ranked_candidates: List[Dict]):
+def display_candidate_ranking(ranked_candidates: List[Dict], job_skills: Optional[Dict[str, List[str]]] = None):
     """Display candidate ranking results"""
     st.markdown("## 🏆 Candidate Ranking Results")
     
@@ -273,6 +441,12 @@ def display_candidate_ranking(ranked_candidates: List[Dict]):
         st.warning("No candidates to rank")
         return
     
+    # One matcher and one job-skill extraction for the whole list, reusing the
+    # skills stored at screening time when the caller passes them in
+    skill_matcher = SkillMatcher()
+    if job_skills is None:
+        job_skills = skill_matcher.extract_job_skills(st.session_state.job_description)
+    
     # Display ALL candidates
     for i, candidate in enumerate(ranked_candidates):
         resume_data = candidate['resume_data']
@@ -300,15 +474,12 @@ def display_candidate_ranking(ranked_candidates: List[Dict]):
             st.markdown("**📄 Resume Details:**")
             if resume_data.get('skills'):
                 st.write(f"• **Skills:** {', '.join(resume_data['skills'])}")
-            st.write(f"• **Experience:** {resume_data.get('experience', 'Not specified')}")
+            st.write(f"• **Experience:** {format_experience(resume_data.get('experience'))}")
             if resume_data.get('education'):
                 st.write(f"• **Education:** {resume_data['education'][0] if resume_data['education'] else 'Not specified'}")
             
             # Debug information (simple display, no nested expanders)
             st.markdown("**🔍 Debug Score Calculation:**")
-            # We need to recreate the skill matcher to access debug function
-            skill_matcher = SkillMatcher()
-            job_skills = skill_matcher.extract_job_skills(st.session_state.job_description)
             skill_matcher.debug_skill_matching(resume_data, job_skills)
     
     # Summary statistics
@@ -336,29 +507,41 @@ def display_comparison_table(ranked_candidates: List[Dict]):
         st.info("Need at least 2 candidates to show comparison table")
         return
     
-    # Create comparison data
-    comparison_data = []
+    # Build the table column by column with numeric columns kept numeric;
+    # the "/100" and "+" decorations are applied only at display time
+    ranks, filenames, overall_scores, skill_scores = [], [], [], []
+    experience_bonuses, education_bonuses, diversity_bonuses = [], [], []
+    skill_counts, experiences, educations = [], [], []
     
     for candidate in ranked_candidates:
         resume_data = candidate['resume_data']
         score_data = candidate['score_data']
         
-        comparison_data.append({
-            'Rank': candidate['rank'],
-            'Filename': resume_data['filename'],
-            'Overall Score': f"{score_data['overall_score']}/100",
-            'Skill Match': f"{score_data['skill_score']}/100",
-            'Experience Bonus': f"+{score_data['experience_bonus']}",
-            'Education Bonus': f"+{score_data['education_bonus']}",
-            'Skills Diversity Bonus': f"+{score_data.get('skills_diversity_bonus', 0)}",
-            'Skills Count': len(resume_data.get('skills', [])),
-            'Experience': resume_data.get('experience', 'Not specified'),
-            'Education': resume_data.get('education', ['Not specified'])[0] if resume_data.get('education') else 'Not specified'
-        })
+        ranks.append(candidate['rank'])
+        filenames.append(resume_data['filename'])
+        overall_scores.append(score_data['overall_score'])
+        skill_scores.append(score_data['skill_score'])
+        experience_bonuses.append(score_data['experience_bonus'])
+        education_bonuses.append(score_data['education_bonus'])
+        diversity_bonuses.append(score_data.get('skills_diversity_bonus', 0))
+        skill_counts.append(len(resume_data.get('skills', [])))
+        experiences.append(format_experience(resume_data.get('experience')))
+        educations.append(resume_data['education'][0] if resume_data.get('education') else 'Not specified')
     
     # Create DataFrame for better display
     import pandas as pd
-    df = pd.DataFrame(comparison_data)
+    df = pd.DataFrame({
+        'Rank': np.array(ranks, dtype=np.int64),
+        'Filename': filenames,
+        'Overall Score': np.array(overall_scores, dtype=float),
+        'Skill Match': np.array(skill_scores, dtype=float),
+        'Experience Bonus': np.array(experience_bonuses, dtype=np.int64),
+        'Education Bonus': np.array(education_bonuses, dtype=np.int64),
+        'Skills Diversity Bonus': np.array(diversity_bonuses, dtype=np.int64),
+        'Skills Count': np.array(skill_counts, dtype=np.int64),
+        'Experience': experiences,
+        'Education': educations
+    })
     
     # Display the comparison table
     st.dataframe(
@@ -368,11 +551,11 @@ def display_comparison_table(ranked_candidates: List[Dict]):
         column_config={
             "Rank": st.column_config.NumberColumn("Rank", help="Candidate ranking"),
             "Filename": st.column_config.TextColumn("Filename", help="Resume file name"),
-            "Overall Score": st.column_config.TextColumn("Overall Score", help="Total score out of 100"),
-            "Skill Match": st.column_config.TextColumn("Skill Match", help="Skill matching percentage"),
-            "Experience Bonus": st.column_config.TextColumn("Exp Bonus", help="Experience bonus points"),
-            "Education Bonus": st.column_config.TextColumn("Edu Bonus", help="Education bonus points"),
-            "Unique Bonus": st.column_config.TextColumn("Unique Bonus", help="Unique identifier bonus"),
+            "Overall Score": st.column_config.NumberColumn("Overall Score", help="Total score out of 100", format="%g/100"),
+            "Skill Match": st.column_config.NumberColumn("Skill Match", help="Skill matching percentage", format="%g/100"),
+            "Experience Bonus": st.column_config.NumberColumn("Exp Bonus", help="Experience bonus points", format="+%d"),
+            "Education Bonus": st.column_config.NumberColumn("Edu Bonus", help="Education bonus points", format="+%d"),
+            "Skills Diversity Bonus": st.column_config.NumberColumn("Diversity Bonus", help="Skills diversity bonus points", format="+%d"),
             "Skills Count": st.column_config.NumberColumn("Skills Count", help="Number of skills detected"),
             "Experience": st.column_config.TextColumn("Experience", help="Years of experience"),
             "Education": st.column_config.TextColumn("Education", help="Highest education level")
@@ -392,16 +575,15 @@ def display_comparison_table(ranked_candidates: List[Dict]):
     st.markdown("---")
     st.markdown("## 🔍 Key Insights")
     
-    # Find best in each category
-    if comparison_data:
-        best_skill_match = max(comparison_data, key=lambda x: float(x['Skill Match'].split('/')[0]))
-        most_skills = max(comparison_data, key=lambda x: x['Skills Count'])
-        highest_exp_bonus = max(comparison_data, key=lambda x: int(x['Experience Bonus'].replace('+', '')))
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("🏆 Best Skill Match", best_skill_match['Filename'], best_skill_match['Skill Match'])
-        with col2:
-            st.metric("🔧 Most Skills", most_skills['Filename'], most_skills['Skills Count'])
-        with col3:
-            st.metric("⏰ Highest Experience", highest_exp_bonus['Filename'], highest_exp_bonus['Experience Bonus'])
+    # Find best in each category; idxmax keeps the first (highest-ranked) row on ties
+    best_skill_match = df.loc[df['Skill Match'].idxmax()]
+    most_skills = df.loc[df['Skills Count'].idxmax()]
+    highest_exp_bonus = df.loc[df['Experience Bonus'].idxmax()]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🏆 Best Skill Match", best_skill_match['Filename'], f"{best_skill_match['Skill Match']:g}/100")
+    with col2:
+        st.metric("🔧 Most Skills", most_skills['Filename'], int(most_skills['Skills Count']))
+    with col3:
+        st.metric("⏰ Highest Experience", highest_exp_bonus['Filename'], f"+{highest_exp_bonus['Experience Bonus']}")